@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import calendar
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import json
 import streamlit as st
 
@@ -17,9 +17,8 @@ import streamlit as st
 from db import (
     add_expense_row,
     add_income_row,
-    get_accounts_df,
-    get_expenses_df,
-    get_income_df,
+    clear_disk_cache,
+    get_all_sheets_df,
     update_expense_row,
     update_income_row,
     delete_expense_row,
@@ -63,8 +62,7 @@ if ('serviceWorker' in navigator) {
 st.markdown(pwa_html, unsafe_allow_html=True)
 
 
-if "page" not in st.session_state:
-    st.session_state.page = "dashboard"
+st.session_state.setdefault("page", "dashboard")
 
 # Mobile-friendly CSS
 def load_css():
@@ -78,49 +76,95 @@ def load_css():
 load_css()
 
 
+# Constant selector options; built once at import instead of per rerun.
+_MONTH_NAMES = list(calendar.month_name)[1:]
+_YEARS = list(range(2023, 2027))
+
+
 # -----------------------------------------------------------------------------
 # Data helpers
 # -----------------------------------------------------------------------------
 @st.cache_data(ttl=60)
-def _load_sheets_cached() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Fetch expenses, income, and accounts worksheets."""
-    expenses = get_expenses_df().copy()
-    income = get_income_df().copy()
-    accounts = get_accounts_df().copy()
+def _load_sheets_cached() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Fetch expenses, income, and accounts worksheets in one batched read.
+
+    Also precomputes the (month, category) expense pivot so the chart's
+    selectors only index into it instead of re-grouping on every rerun.
+    """
+    # No defensive copies needed: the db helpers return fresh frames and
+    # st.cache_data hands each caller its own deserialized object anyway.
+    expenses, income, accounts = get_all_sheets_df()
 
     for frame in (expenses, income):
         if not frame.empty and "Date" in frame.columns:
-            frame["Date"] = pd.to_datetime(frame["Date"], errors="coerce")
-    return expenses, income, accounts
+            # The writer always emits %Y-%m-%d; an explicit format skips
+            # pandas' per-row format inference.
+            frame["Date"] = pd.to_datetime(
+                frame["Date"], format="%Y-%m-%d", errors="coerce", cache=True
+            )
+            # Integer YYYYMM key so monthly filters are a single int compare
+            # instead of two datetime comparisons; NaT dates map to 0.
+            ym = frame["Date"].dt.year * 100 + frame["Date"].dt.month
+            frame["_ym"] = ym.fillna(0).astype("int32")
+        # Low-cardinality labels hash/sort much faster as category dtype.
+        for col in ("Category", "Account", "Type"):
+            if col in frame.columns:
+                frame[col] = frame[col].astype("category")
+        if "Date" in frame.columns:
+            # Sort newest-first once per fetch; index labels are kept so row
+            # positions still map back to worksheet rows for edits/deletes.
+            frame.sort_values("Date", ascending=False, inplace=True)
+
+    pivot = pd.DataFrame()
+    if not expenses.empty and {"Category", "Amount", "_ym"} <= set(expenses.columns):
+        normalized = expenses["Category"].astype(str).str.strip().str.title()
+        amounts = pd.to_numeric(expenses["Amount"], errors="coerce").abs()
+        pivot = (
+            pd.DataFrame({"_ym": expenses["_ym"], "Category": normalized, "Amount": amounts})
+            .dropna(subset=["Amount"])
+            .groupby(["_ym", "Category"], sort=False)["Amount"]
+            .sum()
+            .unstack(fill_value=0.0)
+        )
+
+    return expenses, income, accounts, pivot
 
 
 def load_sheets() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Safe wrapper that surfaces connection problems in the UI."""
     try:
-        return _load_sheets_cached()
+        return _load_sheets_cached()[:3]
     except RuntimeError as exc:
         st.error(f"Google Sheets connection failed: {exc}")
         empty = pd.DataFrame()
         return empty, empty, empty
 
 
+def load_expense_pivot() -> pd.DataFrame:
+    """Cached (YYYYMM, category) expense sums for the monthly chart."""
+    try:
+        return _load_sheets_cached()[3]
+    except RuntimeError:
+        return pd.DataFrame()
+
+
 def refresh_cache() -> None:
     """Clear cached sheet data after any write."""
     _load_sheets_cached.clear()
+    clear_disk_cache()
 
 
 def calculate_monthly_summary(
     expenses: pd.DataFrame, income: pd.DataFrame, target: datetime | None = None
 ) -> dict:
     target = target or datetime.now()
-    start = target.replace(day=1)
-    end = (start + pd.offsets.MonthEnd(0)).to_pydatetime()
+    target_ym = target.year * 100 + target.month
 
     def _filter(df: pd.DataFrame) -> pd.DataFrame:
-        if df.empty or "Date" not in df:
+        if df.empty or "_ym" not in df:
             return pd.DataFrame(columns=df.columns)
-        mask = (df["Date"] >= start) & (df["Date"] <= end)
-        return df.loc[mask].copy()
+        # View is fine here; callers only sum the Amount column.
+        return df.loc[df["_ym"].values == target_ym]
 
     expenses_month = _filter(expenses)
     income_month = _filter(income)
@@ -194,8 +238,10 @@ def render_sidebar() -> None:
         ("Settings", "settings"),
     ]
 
+    # Read session state once; each proxy attribute access takes a lock.
+    current_page = st.session_state.page
     for label, key in menu_items:
-        active = st.session_state.page == key
+        active = current_page == key
         if st.sidebar.button(
             label,
             key=f"nav_{key}",
@@ -273,52 +319,51 @@ def income_form(default_date: datetime | None = None, form_key: str = "income_fo
 # -----------------------------------------------------------------------------
 # Pages
 # -----------------------------------------------------------------------------
-def format_inr(amount: float) -> str:
-    if pd.isna(amount):
-        return "₹0.00"
-    
-    # Handle zero values simply
-    if amount == 0 or abs(amount) < 0.01:
-        return "₹0.00"
+def format_inr_series(amounts: pd.Series) -> pd.Series:
+    """Format a whole Series as Indian-grouped rupee strings in one pass."""
+    values = pd.to_numeric(amounts, errors="coerce").fillna(0.0)
+    absolute = values.abs().round(2)
+    sign = pd.Series(
+        np.where((values < 0) & (absolute >= 0.01), "-", ""), index=values.index
+    )
 
-    sign = "-" if amount < 0 else ""
-    amount = abs(float(amount))
-    integer_part = int(amount)
-    fraction_part = amount - integer_part
+    int_str = absolute.astype("int64").astype(str)
+    frac_str = ((absolute * 100).round().astype("int64") % 100).astype(str).str.zfill(2)
 
-    # Indian numbering system: groups of 2 digits after first 3
-    if integer_part < 1000:
-        # Less than 1,000 - no commas needed
-        formatted_int = str(integer_part)
-    else:
-        # Separate last 3 digits
-        last_three = integer_part % 1000
-        remaining = integer_part // 1000
-        
-        # Build groups of 2 from right to left
-        parts = []
-        while remaining > 0:
-            parts.append(f"{remaining % 100:02d}" if len(parts) > 0 or remaining >= 100 else str(remaining % 100))
-            remaining //= 100
-        
-        # Format: most significant part (no leading zeros) + other parts (with leading zeros) + last 3 digits
-        if parts:
-            # Remove leading zeros from the most significant part
-            parts_reversed = list(reversed(parts))
-            parts_reversed[0] = str(int(parts_reversed[0]))  # Remove leading zeros from first part
-            formatted_int = f"{','.join(parts_reversed)},{last_three:03d}"
-        else:
-            formatted_int = f"{last_three:03d}"
+    # Indian numbering system: last 3 digits, then groups of 2.
+    last_three = int_str.str.slice(-3)
+    remaining = int_str.str.slice(0, -3)
+    grouped = remaining.str.replace(r"(\d)(?=(\d\d)+$)", r"\1,", regex=True)
+    formatted_int = last_three.where(remaining == "", grouped.str.cat(last_three, sep=","))
 
-    formatted_fraction = f"{fraction_part:.2f}"[1:]
-    return f"{sign}₹{formatted_int}{formatted_fraction}"
+    return sign + "₹" + formatted_int + "." + frac_str
 
 
-def show_monthly_expense_chart(expenses: pd.DataFrame) -> None:
-    now = datetime.now()
-    month_names = list(calendar.month_name)[1:]
-    years = list(range(2023, 2027))
+# Inserts a comma after any digit followed by an even number of digits,
+# i.e. groups of two from the right (Indian grouping above the last 3).
+_INR_GROUP_RE = re.compile(r"(\d)(?=(\d\d)+$)")
+
 
+def format_inr(amount: float) -> str:
+    """Scalar counterpart of format_inr_series, for st.metric and friends."""
+    if pd.isna(amount):
+        return "₹0.00"
+    amount = float(amount)
+    if -999.995 < amount < 999.995:
+        # Common case: below 1,000 there is no grouping to insert at all.
+        sign = "-" if amount <= -0.005 else ""
+        return f"{sign}₹{abs(amount):.2f}"
+    sign = "-" if amount <= -0.005 else ""
+    integer, frac = f"{abs(amount):.2f}".split(".")
+    last_three, rest = integer[-3:], integer[:-3]
+    grouped = _INR_GROUP_RE.sub(r"\1,", rest) + "," + last_three if rest else last_three
+    return f"{sign}₹{grouped}.{frac}"
+
+
+@st.fragment
+def show_monthly_expense_chart(expense_pivot: pd.DataFrame) -> None:
+    """Month/year selectors rerun only this fragment, not the whole page."""
+    now = datetime.now()
     default_month = now.month
     default_year = now.year
 
@@ -326,81 +371,71 @@ def show_monthly_expense_chart(expenses: pd.DataFrame) -> None:
     with col_month:
         month_name = st.selectbox(
             "Month",
-            month_names,
+            _MONTH_NAMES,
             index=default_month - 1,
             key="monthly_expense_month",
         )
     with col_year:
         year = st.selectbox(
             "Year",
-            years,
-            index=years.index(default_year) if default_year in years else 0,
+            _YEARS,
+            index=_YEARS.index(default_year) if default_year in _YEARS else 0,
             key="monthly_expense_year",
         )
 
-    month = month_names.index(month_name) + 1
-    filtered = expenses.copy()
+    month = _MONTH_NAMES.index(month_name) + 1
+    ym = year * 100 + month
 
-    if not filtered.empty:
-        filtered["Date"] = pd.to_datetime(filtered.get("Date"), errors="coerce")
-        filtered["Amount"] = pd.to_numeric(filtered.get("Amount"), errors="coerce")
-
-        filtered = filtered.dropna(subset=["Date", "Amount"])  # type: ignore[arg-type]
-        filtered = filtered.loc[
-            (filtered["Date"].dt.month == month)
-            & (filtered["Date"].dt.year == year)
-        ]
-
-    if filtered.empty:
+    if expense_pivot.empty or ym not in expense_pivot.index:
         st.info(
             "No expenses recorded for this month.\nAdd an expense to see the chart update!"
         )
         return
 
-    if "Category" not in filtered.columns:
-        st.warning("Category column is missing in the Expenses sheet.")
+    # Category sums were pivoted once at load; selecting a month is an O(1)
+    # index lookup instead of a filter + groupby per rerun.
+    month_sums = expense_pivot.loc[ym]
+    month_sums = month_sums[month_sums > 0]
+
+    if month_sums.empty:
+        st.info("No expense data available for this month.")
         return
 
-    # Normalize category names to prevent duplicates (e.g., "Food" vs "food" or "Food ")
-    filtered = filtered.copy()
-    filtered["Category"] = filtered["Category"].astype(str).str.strip().str.title()
-    
     grouped = (
-        filtered.assign(Amount=filtered["Amount"].abs())
-        .groupby("Category", as_index=False)["Amount"]
-        .sum()
-        .sort_values(by="Amount", ascending=False)
+        month_sums.sort_values(ascending=False).rename("Amount").reset_index()
     )
 
-    if grouped.empty:
-        st.info("No expense data available for this month.")
-        return
+    # go.Bar skips px's DataFrame introspection, and the hover amount is
+    # formatted client-side so no per-category strings ship to the browser.
+    st.plotly_chart(
+        _build_expense_figure(grouped, month_name, year), use_container_width=True
+    )
 
-    grouped["FormattedAmount"] = grouped["Amount"].apply(format_inr)
 
-    fig = px.bar(
-        grouped,
-        x="Category",
-        y="Amount",
-        title=f"Monthly Expenses - {month_name} {year}",
-        color="Amount",
-        color_continuous_scale="Blues",
-        height=500,
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_expense_figure(grouped: pd.DataFrame, month_name: str, year: int):
+    """Memoize the figure spec; rebuilding it is pure dict churn per rerun."""
+    # Deferred so pages that never render the chart skip plotly's import cost.
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        go.Bar(
+            x=grouped["Category"],
+            y=grouped["Amount"],
+            marker=dict(color=grouped["Amount"], colorscale="Blues", line_width=0),
+            hovertemplate="Category: %{x}<br>Amount: ₹%{y:,.2f}<extra></extra>",
+        )
     )
 
     max_amount = grouped["Amount"].max()
     tick_count = min(6, max(2, len(grouped) + 1))
     tickvals = np.linspace(0, max_amount, tick_count) if max_amount > 0 else [0]
-    ticktext = [format_inr(val) for val in tickvals]
+    ticktext = format_inr_series(pd.Series(tickvals)).tolist()
 
     fig.update_layout(
+        title=f"Monthly Expenses - {month_name} {year}",
+        height=500,
         margin=dict(l=40, r=20, t=60, b=40),
-        coloraxis_showscale=False,
-    )
-    fig.update_traces(
-        marker_line_width=0,
-        customdata=grouped["FormattedAmount"],
-        hovertemplate="Category: %{x}<br>Amount: %{customdata}<extra></extra>",
     )
     fig.update_yaxes(
         title="Amount (₹)",
@@ -409,7 +444,7 @@ def show_monthly_expense_chart(expenses: pd.DataFrame) -> None:
         ticktext=ticktext,
         rangemode="tozero",
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
 def show_dashboard():
@@ -417,7 +452,7 @@ def show_dashboard():
     expenses, income, accounts = load_sheets()
 
     with st.expander("Monthly Expense Insights", expanded=True):
-        show_monthly_expense_chart(expenses)
+        show_monthly_expense_chart(load_expense_pivot())
 
     summary = calculate_monthly_summary(expenses, income)
 
@@ -431,6 +466,25 @@ def show_dashboard():
     )
 
     st.markdown("---")
+    _quick_add_section()
+
+    st.markdown("---")
+    _recent_activity_section(expenses, income)
+
+    st.markdown("---")
+    st.subheader("Accounts Snapshot")
+    if accounts.empty:
+        st.info("No accounts data found in the Accounts worksheet.")
+    else:
+        st.dataframe(
+            accounts,
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
+@st.fragment
+def _quick_add_section() -> None:
     st.subheader("Quick Add")
     c1, c2 = st.columns(2)
     with c1:
@@ -440,31 +494,35 @@ def show_dashboard():
         st.markdown("#### Add Income")
         income_form(form_key="dashboard_income_form")
 
-    st.markdown("---")
+
+@st.fragment
+def _recent_activity_section(expenses: pd.DataFrame, income: pd.DataFrame) -> None:
     st.subheader("Recent Activity")
+    def _recent(frame: pd.DataFrame, label: str) -> pd.DataFrame:
+        if frame.empty:
+            return frame
+        # Frames arrive newest-first from the loader, so head() is enough.
+        return frame.head(10).assign(Type=label)
+
+    # Top-10 of each side first, so the concat touches ~20 rows instead of
+    # both full frames, then an O(n) partial selection instead of a full sort.
     merged = pd.concat(
-        [expenses.assign(Type="Expense"), income.assign(Type="Income")],
+        [_recent(expenses, "Expense"), _recent(income, "Income")],
         ignore_index=True,
     )
     if merged.empty:
         st.info("No transactions yet. Use the forms above to get started!")
     else:
-        merged = merged.sort_values(by="Date", ascending=False).head(10)
+        merged = merged.nlargest(10, "Date") if "Date" in merged.columns else merged.head(10)
         st.dataframe(
             merged[["Date", "Description", "Category", "Amount", "Account", "Type"]],
             use_container_width=True,
             hide_index=True,
-        )
-
-    st.markdown("---")
-    st.subheader("Accounts Snapshot")
-    if accounts.empty:
-        st.info("No accounts data found in the Accounts worksheet.")
-    else:
-        st.dataframe(
-            accounts,
-            use_container_width=True,
-            hide_index=True,
+            column_config={
+                # Format in the frontend instead of building strings per row.
+                "Amount": st.column_config.NumberColumn("Amount", format="₹%.2f"),
+                "Date": st.column_config.DateColumn("Date", format="YYYY-MM-DD"),
+            },
         )
 
 
@@ -509,9 +567,11 @@ def display_editable_transactions(df: pd.DataFrame, is_expense: bool):
     ]
     df_edit = df_display[display_columns].reset_index(drop=True)
     
-    # Ensure Description is treated as editable string (not auto-detected as link)
-    if "Description" in df_edit.columns:
-        df_edit["Description"] = df_edit["Description"].astype(str)
+    # Ensure text columns are plain strings so the editor allows free-form
+    # input (category dtype would render as a fixed-choice selectbox).
+    for col in ("Description", "Category", "Account"):
+        if col in df_edit.columns:
+            df_edit[col] = df_edit[col].astype(str)
     
     # Store original indices for tracking
     original_indices = df_display.index.tolist()
@@ -658,6 +718,8 @@ def display_transactions(df: pd.DataFrame):
         for col in ["Date", "Description", "Category", "Amount", "Account"]
         if col in df_display.columns
     ]
+    if "Amount" in df_display.columns:
+        df_display["Amount"] = format_inr_series(df_display["Amount"])
     st.dataframe(
         df_display[columns],
         use_container_width=True,
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import time
 from functools import wraps
+from pathlib import Path
 from typing import Dict, Callable, TypeVar
 
 import pandas as pd
@@ -108,8 +111,67 @@ def get_connection() -> GSheetsConnection:
     return st.connection("gsheets", type=GSheetsConnection)
 
 
-@retry_on_rate_limit
+# On-disk snapshot cache: keyed by spreadsheet id + worksheet + Drive
+# modifiedTime, so a parquet read (<20 ms) replaces a Sheets round-trip on
+# warm starts while any sheet edit naturally invalidates the key.
+CACHE_DIR = Path(".cache")
+
+
+def _sheet_cache_paths(worksheets: list) -> Dict[str, Path] | None:
+    """Map worksheet names to their cache paths with one metadata fetch."""
+    try:
+        spreadsheet = _get_spreadsheet()
+        if spreadsheet is None:
+            return None
+        modified = spreadsheet.lastUpdateTime
+    except Exception:
+        return None
+    return {
+        worksheet: CACHE_DIR / (
+            hashlib.md5(f"{spreadsheet.id}:{worksheet}:{modified}".encode()).hexdigest()
+            + ".parquet"
+        )
+        for worksheet in worksheets
+    }
+
+
+def _sheet_cache_path(worksheet: str) -> Path | None:
+    paths = _sheet_cache_paths([worksheet])
+    return paths[worksheet] if paths is not None else None
+
+
+def _write_disk_cache(path: Path, df: pd.DataFrame) -> None:
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        df.to_parquet(path, compression="zstd")
+    except Exception:
+        # Snapshotting is best-effort; pyarrow may be unavailable.
+        pass
+
+
+def clear_disk_cache() -> None:
+    """Remove all parquet snapshots (called alongside the in-memory cache clear)."""
+    if CACHE_DIR.exists():
+        for path in CACHE_DIR.glob("*.parquet"):
+            path.unlink(missing_ok=True)
+
+
 def _read_sheet(worksheet: str, *, required: bool = True) -> pd.DataFrame:
+    cache_path = _sheet_cache_path(worksheet)
+    if cache_path is not None and cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path, engine="pyarrow")
+        except Exception:
+            pass
+
+    df = _fetch_sheet(worksheet, required=required)
+    if cache_path is not None and not df.empty:
+        _write_disk_cache(cache_path, df)
+    return df
+
+
+@retry_on_rate_limit
+def _fetch_sheet(worksheet: str, *, required: bool = True) -> pd.DataFrame:
     try:
         df = get_connection().read(
             spreadsheet=_get_spreadsheet_identifier(),
@@ -124,7 +186,7 @@ def _read_sheet(worksheet: str, *, required: bool = True) -> pd.DataFrame:
 
     if df is None:
         return pd.DataFrame()
-    return df.fillna("")
+    return _fill_blank_strings(df)
 
 
 @retry_on_rate_limit
@@ -139,11 +201,108 @@ def _write_sheet(worksheet: str, data: pd.DataFrame) -> None:
         raise RuntimeError(f"Unable to write to '{worksheet}' worksheet: {exc}") from exc
 
 
-def _append_row(worksheet: str, row: Dict) -> pd.DataFrame:
-    df = _read_sheet(worksheet)
-    updated = pd.concat([df, pd.DataFrame([row])], ignore_index=True) if not df.empty else pd.DataFrame([row])
-    _write_sheet(worksheet, updated)
-    return updated
+def _get_spreadsheet():
+    """Return the underlying gspread Spreadsheet, or None for read-only clients."""
+    client = getattr(get_connection()._instance, "client", None)
+    if client is None:
+        return None
+
+    identifier = _get_spreadsheet_identifier()
+    if identifier.startswith("http"):
+        return client.open_by_url(identifier)
+    return client.open_by_key(identifier)
+
+
+def _get_worksheet(worksheet: str):
+    """Return the underlying gspread Worksheet, or None for read-only clients."""
+    spreadsheet = _get_spreadsheet()
+    if spreadsheet is None:
+        return None
+    return spreadsheet.worksheet(worksheet)
+
+
+def _fill_blank_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill NaN with "" in string columns only, keeping numeric dtypes intact.
+
+    A whole-frame fillna("") would push numeric columns like Amount to object
+    dtype and force re-coercion downstream.
+    """
+    str_cols = df.select_dtypes(include="object").columns
+    if len(str_cols):
+        df[str_cols] = df[str_cols].fillna("")
+    return df
+
+
+def _values_to_df(values: list) -> pd.DataFrame:
+    """Build a DataFrame from a raw Sheets value range (first row = header)."""
+    if not values:
+        return pd.DataFrame()
+
+    header, rows = values[0], values[1:]
+    # batchGet trims trailing empty cells, so pad ragged rows to the header.
+    rows = [row + [""] * (len(header) - len(row)) for row in rows]
+    df = pd.DataFrame(rows, columns=header)
+
+    for column in df.columns:
+        numeric = pd.to_numeric(df[column], errors="coerce")
+        non_empty = df[column].astype(str).str.strip() != ""
+        if non_empty.any() and numeric[non_empty].notna().all():
+            df[column] = numeric
+
+    return _fill_blank_strings(df)
+
+
+@retry_on_rate_limit
+def _read_sheets_batch(worksheets: list) -> Dict[str, pd.DataFrame]:
+    """Fetch several worksheets in one spreadsheets.values.batchGet round-trip."""
+    spreadsheet = _get_spreadsheet()
+    if spreadsheet is None:
+        raise WorksheetNotFound("batchGet requires a service account connection")
+
+    result = spreadsheet.values_batch_get(ranges=[f"'{name}'" for name in worksheets])
+    value_ranges = result.get("valueRanges", [])
+    return {
+        name: _values_to_df(value_range.get("values", []))
+        for name, value_range in zip(worksheets, value_ranges)
+    }
+
+
+def _get_header(worksheet: str, ws) -> list:
+    """Return the header row for a worksheet, cached per session."""
+    headers = st.session_state.setdefault("_worksheet_headers", {})
+    if worksheet not in headers:
+        headers[worksheet] = ws.row_values(1)
+    return headers[worksheet]
+
+
+@retry_on_rate_limit
+def _append_row_fast(worksheet: str, row: Dict) -> None:
+    """Append a single row via the Sheets append endpoint (O(1) payload)."""
+    ws = _get_worksheet(worksheet)
+    if ws is None:
+        raise WorksheetNotFound(worksheet)
+
+    header = _get_header(worksheet, ws)
+    values = [row.get(column, "") for column in header] if header else list(row.values())
+    ws.append_row(
+        values,
+        value_input_option="USER_ENTERED",
+        insert_data_option="INSERT_ROWS",
+    )
+
+
+def _append_row(worksheet: str, row: Dict) -> None:
+    try:
+        _append_row_fast(worksheet, row)
+    except RuntimeError:
+        raise
+    except Exception:
+        # Read-only/public connections expose no gspread client; fall back to
+        # the full read-concat-write cycle so writes still succeed.
+        df = _read_sheet(worksheet)
+        updated = pd.concat([df, pd.DataFrame([row])], ignore_index=True) if not df.empty else pd.DataFrame([row])
+        _write_sheet(worksheet, updated)
+    _append_local(worksheet, row)
 
 
 def _update_row(worksheet: str, index: int, row: Dict) -> pd.DataFrame:
@@ -155,8 +314,9 @@ def _update_row(worksheet: str, index: int, row: Dict) -> pd.DataFrame:
     for key, value in row.items():
         if key in df.columns:
             df.at[index, key] = value
-    
+
     _write_sheet(worksheet, df)
+    _write_snapshot(worksheet, df)
     return df
 
 
@@ -168,27 +328,131 @@ def _delete_row(worksheet: str, index: int) -> pd.DataFrame:
     
     df = df.drop(index).reset_index(drop=True)
     _write_sheet(worksheet, df)
+    _write_snapshot(worksheet, df)
     return df
 
 
+# Local snapshots written by scripts/snapshot.py; opted into with
+# USE_SNAPSHOT=1 so reads never touch the Sheets API on the hot path.
+SNAPSHOT_DIR = Path("data")
+
+
+def _use_snapshot() -> bool:
+    return os.environ.get("USE_SNAPSHOT") == "1"
+
+
+def _read_local(worksheet: str) -> pd.DataFrame | None:
+    path = SNAPSHOT_DIR / f"{worksheet}.parquet"
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+
+def _write_snapshot(worksheet: str, df: pd.DataFrame) -> None:
+    """Sync the local snapshot after a successful write.
+
+    Keeps snapshot-mode reads consistent with writes made from the app
+    between cron syncs. If the snapshot cannot be rewritten, it is dropped
+    so reads fall back to the live API until the next sync.
+    """
+    if not _use_snapshot():
+        return
+    path = SNAPSHOT_DIR / f"{worksheet}.parquet"
+    try:
+        SNAPSHOT_DIR.mkdir(exist_ok=True)
+        df.to_parquet(path, compression="zstd")
+    except Exception:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _append_local(worksheet: str, row: Dict) -> None:
+    """Append a freshly written row to the local snapshot, if one exists."""
+    if not _use_snapshot():
+        return
+    local = _read_local(worksheet)
+    if local is None:
+        return
+    updated = pd.concat([local, pd.DataFrame([row])], ignore_index=True) if not local.empty else pd.DataFrame([row])
+    _write_snapshot(worksheet, updated)
+
+
 def get_expenses_df() -> pd.DataFrame:
+    if _use_snapshot():
+        local = _read_local(EXPENSES_WORKSHEET)
+        if local is not None:
+            return local
     return _read_sheet(EXPENSES_WORKSHEET)
 
 
 def get_income_df() -> pd.DataFrame:
+    if _use_snapshot():
+        local = _read_local(INCOME_WORKSHEET)
+        if local is not None:
+            return local
     return _read_sheet(INCOME_WORKSHEET)
 
 
 def get_accounts_df() -> pd.DataFrame:
+    if _use_snapshot():
+        local = _read_local(ACCOUNTS_WORKSHEET)
+        if local is not None:
+            return local
     return _read_sheet(ACCOUNTS_WORKSHEET, required=False)
 
 
-def add_expense_row(data: Dict) -> pd.DataFrame:
-    return _append_row(EXPENSES_WORKSHEET, data)
+def get_all_sheets_df() -> tuple:
+    """Return (expenses, income, accounts) in a single batched read when possible."""
+    worksheets = [EXPENSES_WORKSHEET, INCOME_WORKSHEET, ACCOUNTS_WORKSHEET]
+
+    if _use_snapshot():
+        locals_ = [_read_local(name) for name in worksheets]
+        if all(frame is not None for frame in locals_):
+            return tuple(locals_)
+
+    # Serve all three sheets from the disk cache when the spreadsheet's
+    # modifiedTime still matches; one metadata fetch replaces the batchGet.
+    cache_paths = _sheet_cache_paths(worksheets)
+    if cache_paths is not None:
+        cached = []
+        for name in worksheets:
+            path = cache_paths[name]
+            if not path.exists():
+                break
+            try:
+                cached.append(pd.read_parquet(path, engine="pyarrow"))
+            except Exception:
+                break
+        if len(cached) == len(worksheets):
+            return tuple(cached)
+
+    try:
+        frames = _read_sheets_batch(worksheets)
+    except RuntimeError:
+        raise
+    except Exception:
+        # Read-only/public connections can't batch; fall back to three reads.
+        return get_expenses_df(), get_income_df(), get_accounts_df()
+
+    result = tuple(frames.get(name, pd.DataFrame()) for name in worksheets)
+    if cache_paths is not None:
+        for name, frame in zip(worksheets, result):
+            if not frame.empty:
+                _write_disk_cache(cache_paths[name], frame)
+    return result
+
+
+def add_expense_row(data: Dict) -> None:
+    _append_row(EXPENSES_WORKSHEET, data)
 
 
-def add_income_row(data: Dict) -> pd.DataFrame:
-    return _append_row(INCOME_WORKSHEET, data)
+def add_income_row(data: Dict) -> None:
+    _append_row(INCOME_WORKSHEET, data)
 
 
 def update_expense_row(index: int, data: Dict) -> pd.DataFrame:
@@ -0,0 +1,38 @@
+"""Sync Google Sheets worksheets to local parquet snapshots.
+
+Run periodically (cron, GitHub Actions, etc.) so the app can serve reads
+from `data/{worksheet}.parquet` instead of hitting the Sheets API live.
+Enable the local read path by setting `USE_SNAPSHOT=1` for the app process.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Allow running as `python scripts/snapshot.py` from the repo root.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import db  # noqa: E402
+
+log = logging.getLogger("finco.snapshot")
+
+
+def main() -> None:
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
+    db.SNAPSHOT_DIR.mkdir(exist_ok=True)
+    for worksheet in (
+        db.EXPENSES_WORKSHEET,
+        db.INCOME_WORKSHEET,
+        db.ACCOUNTS_WORKSHEET,
+    ):
+        frame = db._read_sheet(worksheet, required=False)
+        target = db.SNAPSHOT_DIR / f"{worksheet}.parquet"
+        frame.to_parquet(target, compression="zstd")
+        log.info("Snapshotted '%s' (%d rows) -> %s", worksheet, len(frame), target)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,91 @@
+import hashlib
 import os
 import json
+import time
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Any, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, extract, case
+from sqlalchemy import func, and_, or_, extract, case, select, delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from dateutil.relativedelta import relativedelta
 from models import Transaction, Category, Account, AnalyticsCache, CategoryType
 
 # Cache expiration time in seconds (1 hour)
 CACHE_TTL = 3600
 
+try:
+    # orjson is a C extension, several times faster than stdlib json for the
+    # many-small-dicts payloads the cache stores; fall back when unavailable
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def _json_loads(raw: Union[str, bytes]) -> Any:
+        return orjson.loads(raw)
+
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def _json_loads(raw: Union[str, bytes]) -> Any:
+        return json.loads(raw)
+
+    _JSONDecodeError = json.JSONDecodeError
+
+try:
+    # msgpack encodes the numeric-heavy cache payloads faster and smaller
+    # than JSON; the AnalyticsCache.data column is LargeBinary to match.
+    # Fall back to JSON text when msgpack is not installed.
+    import msgpack
+
+    def _pack(obj: Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True, default=str)
+
+    def _unpack(raw: Union[str, bytes]) -> Any:
+        if isinstance(raw, (bytes, bytearray)):
+            return msgpack.unpackb(raw, raw=False)
+        return _json_loads(raw)  # pre-migration rows stored as JSON text
+
+    _UnpackError = (ValueError,)  # msgpack and JSON decode errors both derive from it
+except ImportError:
+    _pack = _json_dumps
+    _unpack = _json_loads
+    _UnpackError = (_JSONDecodeError,)
+
+# Process-local tier in front of the AnalyticsCache table so repeated reruns
+# of the same analytics call within a session skip the DB round-trip.
+_MEM_CACHE: Dict[Tuple[int, str], Tuple[float, Any]] = {}
+_MEM_CACHE_MAX = 1024
+
+
+def _remember(user_id: int, cache_key: str, payload: Any, expires_at: datetime) -> None:
+    """Store a payload in the in-process cache tier."""
+    if len(_MEM_CACHE) >= _MEM_CACHE_MAX:
+        _MEM_CACHE.clear()
+    _MEM_CACHE[(user_id, cache_key)] = (expires_at.timestamp(), payload)
+
 # Helper function to get date range
+@lru_cache(maxsize=64)
+def _date_range_cached(days: int, today_iso: str) -> Tuple[date, date]:
+    end_date = date.fromisoformat(today_iso)
+    return end_date - timedelta(days=days), end_date
+
+
 def get_date_range(days: int = 30) -> Tuple[date, date]:
-    """Get date range for the last N days."""
-    end_date = datetime.utcnow().date()
-    start_date = end_date - timedelta(days=days)
-    return start_date, end_date
+    """Get date range for the last N days.
+
+    Memoized per (days, calendar day) so repeated reruns within the same
+    day skip the date arithmetic.
+    """
+    return _date_range_cached(days, datetime.utcnow().date().isoformat())
 
 def get_cached_data(
     db: Session, 
@@ -26,17 +93,30 @@ def get_cached_data(
     cache_key: str
 ) -> Optional[Dict]:
     """Retrieve cached analytics data if valid."""
-    cache = db.query(AnalyticsCache).filter(
-        AnalyticsCache.user_id == user_id,
-        AnalyticsCache.cache_key == cache_key,
-        AnalyticsCache.expires_at > datetime.utcnow()
+    entry = _MEM_CACHE.get((user_id, cache_key))
+    if entry is not None:
+        expires_ts, payload = entry
+        if expires_ts > time.time():
+            return payload
+        _MEM_CACHE.pop((user_id, cache_key), None)
+
+    # Core select of the two needed columns; skipping ORM hydration of an
+    # AnalyticsCache instance is noticeably cheaper on hot cache reads
+    row = db.execute(
+        select(AnalyticsCache.data, AnalyticsCache.expires_at).where(
+            AnalyticsCache.user_id == user_id,
+            AnalyticsCache.cache_key == cache_key,
+            AnalyticsCache.expires_at > datetime.utcnow()
+        )
     ).first()
-    
-    if cache and not cache.is_expired():
+
+    if row is not None:
         try:
-            return json.loads(cache.data)
-        except json.JSONDecodeError:
+            payload = _unpack(row.data)
+        except _UnpackError:
             return None
+        _remember(user_id, cache_key, payload, row.expires_at)
+        return payload
     return None
 
 def set_cached_data(
@@ -46,31 +126,50 @@ def set_cached_data(
     data: Any,
     ttl: int = CACHE_TTL
 ) -> None:
-    """Store data in cache."""
-    cache = db.query(AnalyticsCache).filter(
-        AnalyticsCache.user_id == user_id,
-        AnalyticsCache.cache_key == cache_key
-    ).first()
-    
-    cache_data = {
-        'data': data,
-        'cached_at': datetime.utcnow().isoformat()
-    }
-    
-    if cache:
-        cache.data = json.dumps(cache_data)
-        cache.expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-    else:
-        cache = AnalyticsCache(
-            user_id=user_id,
-            cache_key=cache_key,
-            data=json.dumps(cache_data),
-            expires_at=datetime.utcnow() + timedelta(seconds=ttl)
-        )
-    
-    db.add(cache)
+    """Store data in cache with a single upsert round-trip.
+
+    The payload is stored bare; getters receive exactly what was cached.
+    """
+    expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+
+    stmt = sqlite_insert(AnalyticsCache).values(
+        user_id=user_id,
+        cache_key=cache_key,
+        data=_pack(data),
+        expires_at=expires_at
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['user_id', 'cache_key'],
+        set_={'data': stmt.excluded.data, 'expires_at': stmt.excluded.expires_at}
+    )
+    db.execute(stmt)
     db.commit()
 
+    # Write through so the next read in this process skips the DB
+    _remember(user_id, cache_key, data, expires_at)
+
+def invalidate_user_cache(
+    db: Session,
+    user_id: int,
+    prefix: Optional[str] = None
+) -> None:
+    """Drop cached analytics for a user, optionally by cache-key prefix.
+
+    Transaction writers should call this so affected slices refresh on the
+    next read instead of serving stale data until the TTL runs out, e.g.
+    ``invalidate_user_cache(db, user_id, 'spending_')``.
+    """
+    stmt = delete(AnalyticsCache).where(AnalyticsCache.user_id == user_id)
+    if prefix is not None:
+        stmt = stmt.where(AnalyticsCache.cache_key.like(f"{prefix}%"))
+    db.execute(stmt)
+    db.commit()
+
+    # Mirror the deletion in the in-process tier
+    for uid, key in list(_MEM_CACHE):
+        if uid == user_id and (prefix is None or key.startswith(prefix)):
+            _MEM_CACHE.pop((uid, key), None)
+
 def get_spending_by_category(
     db: Session, 
     user_id: int, 
@@ -84,58 +183,51 @@ def get_spending_by_category(
     if cached_data:
         return cached_data
     
-    # Get all categories including those with no transactions
-    categories = db.query(Category).filter(
-        Category.user_id == user_id,
-        Category.type == category_type
-    ).all()
-    
-    # Get transactions for the date range
-    transactions = db.query(
-        Transaction.category_id,
+    # One LEFT OUTER JOIN keeps zero-spend categories in the result while
+    # summing expenses, replacing the two queries and the Python dict merge.
+    # The transaction filters live in the CASE so unmatched rows count as 0.
+    rows = db.query(
+        Category.category_id,
         Category.name.label('category_name'),
-        func.sum(Transaction.amount).label('total_amount')
-    ).join(
-        Category, Transaction.category_id == Category.category_id
+        func.coalesce(
+            func.sum(
+                case(
+                    (
+                        and_(
+                            Transaction.user_id == user_id,
+                            Transaction.amount < 0,
+                            Transaction.date.between(start_date, end_date),
+                            ~Transaction.is_deleted
+                        ),
+                        -Transaction.amount
+                    ),
+                    else_=0.0
+                )
+            ),
+            0.0
+        ).label('amount')
+    ).outerjoin(
+        Transaction, Transaction.category_id == Category.category_id
     ).filter(
-        Transaction.user_id == user_id,
-        Transaction.date.between(start_date, end_date),
-        Transaction.amount < 0,  # Only expenses
-        ~Transaction.is_deleted
+        Category.user_id == user_id,
+        Category.type == category_type
     ).group_by(
-        Transaction.category_id,
+        Category.category_id,
         Category.name
     ).all()
-    
-    # Create a dictionary of category totals
-    category_totals = {}
-    for cat in categories:
-        category_totals[cat.category_id] = {
-            'category_id': cat.category_id,
-            'category_name': cat.name,
-            'amount': 0.0,
-            'percentage': 0.0
+
+    total_spent = sum(row.amount for row in rows)
+
+    result = [
+        {
+            'category_id': row.category_id,
+            'category_name': row.category_name,
+            'amount': float(row.amount),
+            'percentage': (row.amount / total_spent * 100) if total_spent > 0 else 0.0
         }
-    
-    # Update with actual transaction data
-    total_spent = 0.0
-    for t in transactions:
-        if t.category_id in category_totals:
-            amount = abs(t.total_amount or 0)
-            category_totals[t.category_id]['amount'] = amount
-            total_spent += amount
-    
-    # Calculate percentages
-    for cat_id, data in category_totals.items():
-        if total_spent > 0:
-            data['percentage'] = (data['amount'] / total_spent) * 100
-    
-    # Convert to list and sort by amount
-    result = sorted(
-        category_totals.values(),
-        key=lambda x: x['amount'],
-        reverse=True
-    )
+        for row in rows
+    ]
+    result.sort(key=lambda x: x['amount'], reverse=True)
     
     # Cache the result
     set_cached_data(db, user_id, cache_key, result)
@@ -154,30 +246,25 @@ def get_income_vs_expenses(
     if cached_data:
         return cached_data
     
-    # Get total expenses (negative amounts)
-    expenses = db.query(
-        func.coalesce(func.sum(Transaction.amount), 0.0)
+    # Single scan: conditional sums give income and expenses in one query
+    # instead of two round-trips over the same date-range index
+    income, expenses = db.query(
+        func.coalesce(
+            func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0.0)), 0.0
+        ).label('income'),
+        func.coalesce(
+            func.sum(case((Transaction.amount < 0, -Transaction.amount), else_=0.0)), 0.0
+        ).label('expenses')
     ).filter(
         Transaction.user_id == user_id,
-        Transaction.amount < 0,
         Transaction.date.between(start_date, end_date),
         ~Transaction.is_deleted
-    ).scalar() or 0.0
-    
-    # Get total income (positive amounts)
-    income = db.query(
-        func.coalesce(func.sum(Transaction.amount), 0.0)
-    ).filter(
-        Transaction.user_id == user_id,
-        Transaction.amount > 0,
-        Transaction.date.between(start_date, end_date),
-        ~Transaction.is_deleted
-    ).scalar() or 0.0
-    
+    ).one()
+
     result = {
         'income': float(income),
-        'expenses': float(abs(expenses)),
-        'savings': float(income + expenses)  # expenses is negative
+        'expenses': float(expenses),  # negated in SQL, already non-negative
+        'savings': float(income - expenses)
     }
     
     # Cache the result
@@ -198,66 +285,63 @@ def get_spending_trends(
     if cached_data:
         return cached_data
     
-    # Determine the date part to group by
+    # Group on integer date parts via extract() rather than SQLite-only
+    # strftime strings; the period label is rebuilt in Python below
     if group_by == 'day':
-        date_format = '%Y-%m-%d'
-        date_trunc = func.date(Transaction.date)
+        group_cols = [
+            extract('year', Transaction.date).label('y'),
+            extract('month', Transaction.date).label('m'),
+            extract('day', Transaction.date).label('d'),
+        ]
     elif group_by == 'week':
-        date_format = '%Y-W%U'
-        date_trunc = func.strftime('%Y-W%W', Transaction.date)
+        group_cols = [
+            extract('year', Transaction.date).label('y'),
+            extract('week', Transaction.date).label('w'),
+        ]
     elif group_by == 'month':
-        date_format = '%Y-%m'
-        date_trunc = func.strftime('%Y-%m', Transaction.date)
+        group_cols = [
+            extract('year', Transaction.date).label('y'),
+            extract('month', Transaction.date).label('m'),
+        ]
     else:  # year
-        date_format = '%Y'
-        date_trunc = func.strftime('%Y', Transaction.date)
-    
-    # Query for expenses
-    expenses = db.query(
-        date_trunc.label('period'),
-        func.sum(Transaction.amount).label('amount')
-    ).filter(
-        Transaction.user_id == user_id,
-        Transaction.amount < 0,
-        Transaction.date.between(start_date, end_date),
-        ~Transaction.is_deleted
-    ).group_by(
-        'period'
-    ).order_by(
-        'period'
-    ).all()
-    
-    # Query for income
-    income = db.query(
-        date_trunc.label('period'),
-        func.sum(Transaction.amount).label('amount')
+        group_cols = [extract('year', Transaction.date).label('y')]
+
+    # One grouped scan with conditional sums replaces the separate
+    # income/expense queries and the Python-side dict merge
+    rows = db.query(
+        *group_cols,
+        func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0.0)).label('income'),
+        func.sum(case((Transaction.amount < 0, -Transaction.amount), else_=0.0)).label('expenses')
     ).filter(
         Transaction.user_id == user_id,
-        Transaction.amount > 0,
         Transaction.date.between(start_date, end_date),
         ~Transaction.is_deleted
     ).group_by(
-        'period'
+        *group_cols
     ).order_by(
-        'period'
+        *group_cols
     ).all()
-    
-    # Convert to dictionaries for easier processing
-    expense_dict = {e.period: abs(e.amount) for e in expenses}
-    income_dict = {i.period: i.amount for i in income}
-    
-    # Get all unique periods
-    all_periods = sorted(set(list(expense_dict.keys()) + list(income_dict.keys())))
-    
-    # Build result
-    result = []
-    for period in all_periods:
-        result.append({
-            'period': period,
-            'expenses': float(expense_dict.get(period, 0.0)),
-            'income': float(income_dict.get(period, 0.0)),
-            'savings': float(income_dict.get(period, 0.0) - expense_dict.get(period, 0.0))
-        })
+
+    # Build result with vectorized operations instead of a per-row loop
+    part_names = [col.name for col in group_cols]
+    df = pd.DataFrame(rows, columns=part_names + ['income', 'expenses'])
+
+    def _part(name: str, width: int) -> pd.Series:
+        return df[name].astype('int64').astype(str).str.zfill(width)
+
+    if group_by == 'day':
+        df['period'] = _part('y', 4) + '-' + _part('m', 2) + '-' + _part('d', 2)
+    elif group_by == 'week':
+        df['period'] = _part('y', 4) + '-W' + _part('w', 2)
+    elif group_by == 'month':
+        df['period'] = _part('y', 4) + '-' + _part('m', 2)
+    else:  # year
+        df['period'] = _part('y', 4)
+
+    df['income'] = df['income'].fillna(0.0).astype(float)
+    df['expenses'] = df['expenses'].fillna(0.0).astype(float)
+    df['savings'] = df['income'] - df['expenses']
+    result = df[['period', 'income', 'expenses', 'savings']].to_dict(orient='records')
     
     # Cache the result
     set_cached_data(db, user_id, cache_key, result)
@@ -271,41 +355,60 @@ def get_account_balances(db: Session, user_id: int) -> List[Dict]:
     if cached_data:
         return cached_data
     
-    # Get all accounts with their current balance
-    accounts = db.query(
-        Account
+    # Fetch only the needed columns, with the grand total via a window
+    # function and the sort done by the DB — no ORM objects, no Python sums
+    total_expr = func.sum(Account.balance).over().label('total')
+    rows = db.query(
+        Account.account_id,
+        Account.name,
+        Account.balance,
+        Account.currency,
+        total_expr
     ).filter(
         Account.user_id == user_id,
         ~Account.is_deleted
+    ).order_by(
+        Account.balance.desc()
     ).all()
-    
-    # Calculate total balance
-    total_balance = sum(account.balance for account in accounts)
-    
-    # Prepare result
-    result = []
-    for account in accounts:
-        percentage = (account.balance / total_balance * 100) if total_balance != 0 else 0
-        result.append({
-            'account_id': account.account_id,
-            'name': account.name,
-            'balance': float(account.balance),
-            'currency': account.currency,
-            'percentage': float(percentage)
-        })
-    
-    # Sort by balance (highest first)
-    result.sort(key=lambda x: x['balance'], reverse=True)
+
+    result = [
+        {
+            'account_id': row.account_id,
+            'name': row.name,
+            'balance': float(row.balance),
+            'currency': row.currency,
+            'percentage': float(row.balance / row.total * 100) if row.total else 0.0
+        }
+        for row in rows
+    ]
     
     # Cache the result (with a shorter TTL since account balances change frequently)
     set_cached_data(db, user_id, cache_key, result, ttl=600)  # 10 minutes
     
     return result
 
+def _sum_balances_and_debt(db: Session, user_id: int) -> Tuple[float, float]:
+    """Return (total balance, total debt) for a user in one aggregate query.
+
+    The health score only needs these two sums; this skips the per-account
+    dict construction done by get_account_balances.
+    """
+    row = db.query(
+        func.coalesce(func.sum(Account.balance), 0.0),
+        func.coalesce(
+            func.sum(case((Account.balance < 0, Account.balance), else_=0.0)), 0.0
+        )
+    ).filter(
+        Account.user_id == user_id,
+        ~Account.is_deleted
+    ).one()
+    return float(row[0]), float(row[1])
+
 def get_financial_health_score(
-    db: Session, 
-    user_id: int, 
-    months: int = 12
+    db: Session,
+    user_id: int,
+    months: int = 12,
+    db_factory: Optional[Callable[[], Session]] = None
 ) -> Dict[str, Any]:
     """Calculate a financial health score (0-100)."""
     end_date = datetime.utcnow().date()
@@ -316,25 +419,38 @@ def get_financial_health_score(
     if cached_data:
         return cached_data
     
-    # Get income and expenses
-    income_expenses = get_income_vs_expenses(db, user_id, start_date, end_date)
-    
+    # The two aggregates are independent; with a session factory each runs in
+    # its own thread/session so wall time is max(t1, t2) instead of t1 + t2
+    if db_factory is not None:
+        def _with_session(fn, *args):
+            session = db_factory()
+            try:
+                return fn(session, *args)
+            finally:
+                session.close()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_ie = executor.submit(
+                _with_session, get_income_vs_expenses, user_id, start_date, end_date
+            )
+            future_ab = executor.submit(_with_session, _sum_balances_and_debt, user_id)
+            income_expenses = future_ie.result()
+            total_balance, debt = future_ab.result()
+    else:
+        income_expenses = get_income_vs_expenses(db, user_id, start_date, end_date)
+        total_balance, debt = _sum_balances_and_debt(db, user_id)
+
     # Calculate savings rate (savings / income)
     if income_expenses['income'] > 0:
         savings_rate = (income_expenses['savings'] / income_expenses['income']) * 100
     else:
         savings_rate = 0.0
-    
-    # Get account balances
-    accounts = get_account_balances(db, user_id)
-    total_balance = sum(acc['balance'] for acc in accounts)
-    
+
     # Calculate emergency fund (months of expenses covered)
-    avg_monthly_expenses = abs(income_expenses['expenses']) / months
+    avg_monthly_expenses = income_expenses['expenses'] / months
     emergency_fund_months = (total_balance / avg_monthly_expenses) if avg_monthly_expenses > 0 else 0
     
     # Calculate debt-to-income ratio
-    debt = sum(acc['balance'] for acc in accounts if acc['balance'] < 0)
     debt_to_income = (abs(debt) / income_expenses['income']) if income_expenses['income'] > 0 else 0
     
     # Calculate score components (0-100 each)
@@ -361,13 +477,55 @@ def get_financial_health_score(
     
     return result
 
-def create_spending_by_category_plot(data: List[Dict], title: str = "Spending by Category") -> go.Figure:
-    """Create a donut chart for spending by category."""
+# Figure JSON keyed by a hash of the builder inputs; Streamlit reruns with
+# unchanged analytics data revive the figure from JSON instead of redoing
+# the pandas and plotly construction work. Storing JSON (not the go.Figure)
+# means each caller gets a fresh figure that it can mutate freely.
+_FIGURE_CACHE: Dict[str, Optional[str]] = {}
+_FIGURE_CACHE_MAX = 64
+
+
+def _memoize_figure(build: Callable[..., Optional[go.Figure]]) -> Callable[..., Optional[go.Figure]]:
+    """Memoize a figure builder on a hash of its JSON-serializable inputs."""
+    def wrapper(*args, **kwargs):
+        try:
+            fingerprint = _json_dumps([build.__name__, args, kwargs])
+        except (TypeError, ValueError):
+            return build(*args, **kwargs)
+        key = hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+        if key not in _FIGURE_CACHE:
+            if len(_FIGURE_CACHE) >= _FIGURE_CACHE_MAX:
+                _FIGURE_CACHE.clear()
+            fig = build(*args, **kwargs)
+            _FIGURE_CACHE[key] = None if fig is None else fig.to_json()
+            return fig
+        raw = _FIGURE_CACHE[key]
+        return None if raw is None else pio.from_json(raw)
+
+    wrapper.__name__ = build.__name__
+    wrapper.__doc__ = build.__doc__
+    return wrapper
+
+
+@_memoize_figure
+def create_spending_by_category_plot(
+    data: List[Dict],
+    title: str = "Spending by Category",
+    *,
+    df: Optional[pd.DataFrame] = None
+) -> go.Figure:
+    """Create a donut chart for spending by category.
+
+    A caller rendering several plots from the same dataset can build the
+    DataFrame once and pass it via ``df``.
+    """
     if not data:
         return None
-        
-    df = pd.DataFrame(data)
-    
+
+    if df is None:
+        # Explicit column list skips per-dict column inference
+        df = pd.DataFrame.from_records(data, columns=['category_name', 'amount'])
+
     # Filter out categories with 0 amount
     df = df[df['amount'] > 0]
     
@@ -400,6 +558,7 @@ def create_spending_by_category_plot(data: List[Dict], title: str = "Spending by
     
     return fig
 
+@_memoize_figure
 def create_income_vs_expenses_plot(data: Dict, title: str = "Income vs Expenses") -> go.Figure:
     """Create a bar chart for income vs expenses."""
     if not data:
@@ -436,38 +595,54 @@ def create_income_vs_expenses_plot(data: Dict, title: str = "Income vs Expenses"
     
     return fig
 
-def create_spending_trends_plot(data: List[Dict], title: str = "Spending Trends") -> go.Figure:
-    """Create a line chart for spending trends over time."""
+@_memoize_figure
+def create_spending_trends_plot(
+    data: List[Dict],
+    title: str = "Spending Trends",
+    *,
+    df: Optional[pd.DataFrame] = None
+) -> go.Figure:
+    """Create a line chart for spending trends over time.
+
+    A caller rendering several plots from the same dataset can build the
+    DataFrame once and pass it via ``df``.
+    """
     if not data:
         return None
-    
-    df = pd.DataFrame(data)
+
+    if df is None:
+        df = pd.DataFrame.from_records(
+            data, columns=['period', 'income', 'expenses', 'savings']
+        )
     
     # Create the figure
     fig = go.Figure()
-    
-    # Add traces for income, expenses, and savings
-    fig.add_trace(go.Scatter(
-        x=df['period'],
-        y=df['income'],
+
+    # numpy arrays serialize more compactly than Python lists, and the WebGL
+    # traces keep long daily/weekly series responsive in the browser
+    periods = df['period'].to_numpy()
+
+    fig.add_trace(go.Scattergl(
+        x=periods,
+        y=df['income'].to_numpy(),
         name='Income',
         mode='lines+markers',
         line=dict(color='#2ecc71', width=3),
         hovertemplate='%{x}<br>Income: $%{y:,.2f}<extra></extra>'
     ))
-    
-    fig.add_trace(go.Scatter(
-        x=df['period'],
-        y=df['expenses'],
+
+    fig.add_trace(go.Scattergl(
+        x=periods,
+        y=df['expenses'].to_numpy(),
         name='Expenses',
         mode='lines+markers',
         line=dict(color='#e74c3c', width=3),
         hovertemplate='%{x}<br>Expenses: $%{y:,.2f}<extra></extra>'
     ))
-    
-    fig.add_trace(go.Scatter(
-        x=df['period'],
-        y=df['savings'],
+
+    fig.add_trace(go.Scattergl(
+        x=periods,
+        y=df['savings'].to_numpy(),
         name='Savings',
         mode='lines+markers',
         line=dict(color='#3498db', width=3, dash='dash'),
@@ -1,9 +1,39 @@
 """Helper functions for Google Sheets credentials management."""
 
 import json
+import re
 import streamlit as st
 from typing import Dict, Optional, Tuple
 
+try:
+    # orjson parses the multi-KB service-account blob several times faster
+    # than stdlib json; fall back when it is not installed
+    import orjson
+
+    def _json_loads(raw: str) -> Dict:
+        return orjson.loads(raw)
+
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Cheap prescreen: a valid service-account file always carries this pair,
+# so blobs without it can be rejected before the full parse
+_SERVICE_ACCOUNT_RE = re.compile(r'"type"\s*:\s*"service_account"')
+
+# Top-level keys a service-account file must carry
+_REQUIRED_FIELDS = frozenset({
+    'type',
+    'project_id',
+    'private_key_id',
+    'private_key',
+    'client_email',
+    'client_id',
+    'auth_uri',
+    'token_uri',
+})
+
 
 def validate_json_credentials(json_str: str) -> Tuple[bool, Optional[Dict], str]:
     """
@@ -15,27 +45,19 @@ def validate_json_credentials(json_str: str) -> Tuple[bool, Optional[Dict], str]
     Returns:
         Tuple of (is_valid, credentials_dict, error_message)
     """
+    if not _SERVICE_ACCOUNT_RE.search(json_str):
+        return False, None, "Credentials must be for a service account"
+
     try:
-        credentials = json.loads(json_str)
-    except json.JSONDecodeError as e:
+        credentials = _json_loads(json_str)
+    except _JSONDecodeError as e:
         return False, None, f"Invalid JSON format: {str(e)}"
     
-    # Check for required fields
-    required_fields = [
-        'type',
-        'project_id',
-        'private_key_id',
-        'private_key',
-        'client_email',
-        'client_id',
-        'auth_uri',
-        'token_uri'
-    ]
-    
-    missing_fields = [field for field in required_fields if field not in credentials]
-    
+    # Check for required fields with one set-difference
+    missing_fields = _REQUIRED_FIELDS.difference(credentials)
+
     if missing_fields:
-        return False, None, f"Missing required fields: {', '.join(missing_fields)}"
+        return False, None, f"Missing required fields: {', '.join(sorted(missing_fields))}"
     
     # Validate it's a service account
     if credentials.get('type') != 'service_account':